@@ -32,6 +32,14 @@ class LeadUpdate(BaseModel):
     employees: Optional[str] = None
     revenue_band: Optional[str] = None
     founded_year: Optional[int] = None
+    score: Optional[float] = None
+    qualification_label: Optional[str] = None
+    scrape_confidence: Optional[float] = None
+    email_confidence: Optional[float] = None
+    enrichment_confidence: Optional[float] = None
+    enrichment_source: Optional[str] = None
+    email_source: Optional[str] = None
+    scrape_source: Optional[str] = None
     outreach_message: Optional[str] = None
     is_active: Optional[bool] = None
 
@@ -3,7 +3,7 @@ CRUD operations for database models
 """
 
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 from sqlalchemy import and_, or_
 from core.domain.models.user import User
 from core.domain.models.organization import Organization
@@ -129,6 +129,22 @@ def get_lead(db: Session, lead_id: int) -> Optional[Lead]:
     return db.query(Lead).filter(Lead.id == lead_id).first()
 
 
+def get_lead_minimal(db: Session, lead_id: int) -> Optional[Lead]:
+    """
+    Get a lead by ID, loading only the columns scraping needs.
+
+    Skips the wide TEXT columns (about_text, outreach_message, scraped
+    payloads) so the row pulled before a long scrape stays small; use
+    get_lead for the fully populated row.
+    """
+    return (
+        db.query(Lead)
+        .options(load_only(Lead.id, Lead.website, Lead.organization_id))
+        .filter(Lead.id == lead_id)
+        .first()
+    )
+
+
 def get_leads_by_organization(
     db: Session, organization_id: int, skip: int = 0, limit: int = 100
 ) -> List[Lead]:
@@ -151,14 +167,24 @@ def get_leads_by_owner(
     )
 
 
-def update_lead(db: Session, lead_id: int, lead_update: LeadUpdate) -> Optional[Lead]:
-    """Update a lead"""
+def update_lead(
+    db: Session, lead_id: int, lead_update: LeadUpdate, commit: bool = True
+) -> Optional[Lead]:
+    """
+    Update a lead.
+
+    Pass commit=False to flush within the caller's transaction instead
+    of committing, so several writes can share a single commit.
+    """
     db_lead = get_lead(db, lead_id)
     if db_lead:
         for field, value in lead_update.dict(exclude_unset=True).items():
             setattr(db_lead, field, value)
-        db.commit()
-        db.refresh(db_lead)
+        if commit:
+            db.commit()
+            db.refresh(db_lead)
+        else:
+            db.flush()
     return db_lead
 
 
@@ -294,8 +320,14 @@ def create_lead_enrichment_log(
     enrichment_data: str,
     confidence_score: float,
     processing_time_ms: Optional[int] = None,
+    commit: bool = True,
 ) -> LeadEnrichmentLog:
-    """Create a new lead enrichment log entry"""
+    """
+    Create a new lead enrichment log entry.
+
+    Pass commit=False to flush within the caller's transaction instead
+    of committing, so several writes can share a single commit.
+    """
     db_log = LeadEnrichmentLog(
         lead_id=lead_id,
         enrichment_type=enrichment_type,
@@ -304,8 +336,11 @@ def create_lead_enrichment_log(
         processing_time_ms=processing_time_ms,
     )
     db.add(db_log)
-    db.commit()
-    db.refresh(db_log)
+    if commit:
+        db.commit()
+        db.refresh(db_log)
+    else:
+        db.flush()
     return db_log
 
 
@@ -319,8 +354,14 @@ def create_scraping_log(
     error_message: Optional[str] = None,
     processing_time_ms: Optional[int] = None,
     scraped_data: Optional[str] = None,
+    commit: bool = True,
 ) -> ScrapingLog:
-    """Create a new scraping log entry"""
+    """
+    Create a new scraping log entry.
+
+    Pass commit=False to flush within the caller's transaction instead
+    of committing, so several writes can share a single commit.
+    """
     db_log = ScrapingLog(
         lead_id=lead_id,
         scraping_method=scraping_method,
@@ -331,6 +372,9 @@ def create_scraping_log(
         scraped_data=scraped_data,
     )
     db.add(db_log)
-    db.commit()
-    db.refresh(db_log)
+    if commit:
+        db.commit()
+        db.refresh(db_log)
+    else:
+        db.flush()
     return db_log
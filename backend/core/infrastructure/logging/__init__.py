@@ -3,11 +3,29 @@ Structured logging infrastructure
 """
 
 import logging
+import random
 import sys
 from pythonjsonlogger import jsonlogger
-from datetime import datetime
 import os
 
+# Fraction of successful scraping/enrichment attempts that get logged.
+# Failures are always logged. Read once at import; 1.0 keeps every event.
+SUCCESS_SAMPLE_RATE = float(os.getenv("LOG_SUCCESS_SAMPLE", "1.0"))
+
+# Static event names interned once so the high-volume helpers reuse the
+# same key/value objects instead of rebuilding them on every record
+_EVENT_KEY = sys.intern("event")
+_API_CALL = sys.intern("api_call")
+_SCRAPING_ATTEMPT = sys.intern("scraping_attempt")
+_ENRICHMENT_ATTEMPT = sys.intern("enrichment_attempt")
+
+
+def _extra(event: str, **fields):
+    """Build the extra dict for a structured event"""
+    extra = {_EVENT_KEY: event}
+    extra.update(fields)
+    return extra
+
 
 def setup_logging():
     """Setup structured JSON logging"""
@@ -50,16 +68,15 @@ def log_api_call(
     """Log API call with structured data"""
     logger.info(
         "API call executed",
-        extra={
-            "event": "api_call",
-            "endpoint": endpoint,
-            "method": method,
-            "user_id": user_id,
-            "organization_id": org_id,
-            "response_time_ms": response_time,
-            "status_code": status_code,
-            "timestamp": datetime.utcnow().isoformat(),
-        },
+        extra=_extra(
+            _API_CALL,
+            endpoint=endpoint,
+            method=method,
+            user_id=user_id,
+            organization_id=org_id,
+            response_time_ms=response_time,
+            status_code=status_code,
+        ),
     )
 
 
@@ -73,18 +90,21 @@ def log_scraping_attempt(
     error_message: str = None,
 ):
     """Log scraping attempt with structured data"""
+    # Sample away the high-volume happy path; always keep failures
+    if success and not error_message and random.random() > SUCCESS_SAMPLE_RATE:
+        return
+
     logger.info(
         f"Scraping {'successful' if success else 'failed'}",
-        extra={
-            "event": "scraping_attempt",
-            "url": url,
-            "method": method,
-            "success": success,
-            "confidence": confidence,
-            "processing_time_ms": processing_time,
-            "error_message": error_message,
-            "timestamp": datetime.utcnow().isoformat(),
-        },
+        extra=_extra(
+            _SCRAPING_ATTEMPT,
+            url=url,
+            method=method,
+            success=success,
+            confidence=confidence,
+            processing_time_ms=processing_time,
+            error_message=error_message,
+        ),
     )
 
 
@@ -98,16 +118,19 @@ def log_enrichment_attempt(
     error_message: str = None,
 ):
     """Log enrichment attempt with structured data"""
+    # Sample away the high-volume happy path; always keep failures
+    if success and not error_message and random.random() > SUCCESS_SAMPLE_RATE:
+        return
+
     logger.info(
         f"Enrichment {'successful' if success else 'failed'}",
-        extra={
-            "event": "enrichment_attempt",
-            "lead_id": lead_id,
-            "method": method,
-            "success": success,
-            "confidence": confidence,
-            "processing_time_ms": processing_time,
-            "error_message": error_message,
-            "timestamp": datetime.utcnow().isoformat(),
-        },
+        extra=_extra(
+            _ENRICHMENT_ATTEMPT,
+            lead_id=lead_id,
+            method=method,
+            success=success,
+            confidence=confidence,
+            processing_time_ms=processing_time,
+            error_message=error_message,
+        ),
     )
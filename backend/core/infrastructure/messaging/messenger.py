@@ -2,9 +2,12 @@
 Data-locked prompt system for outreach message generation
 """
 
+import asyncio
 import os
+import re
 import time
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 from enum import Enum
 
 from core.domain.models.lead import Lead
@@ -12,6 +15,39 @@ from core.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Compiled once at import so each style transform is a single C-level pass
+# over the message instead of one str.replace scan per substitution
+_PRO_RE = re.compile(r"\bHi ")
+_FRIEND_RE = re.compile(r"\b(Dear |Best regards,)")
+_FRIEND_SUBS = {"Dear ": "Hi ", "Best regards,": "Cheers,"}
+
+
+# Fallback templates as module-level constants. Only the selected
+# template is formatted per call, instead of rebuilding every industry
+# variant as f-strings on each invocation.
+_INDUSTRY_TEMPLATES = {
+    "software": "Hi {contact_ref},\n\nI came across {company_ref} in the software space and was impressed by your work. At {sender_org}, we help software companies optimize their operations and growth. I'd love to explore how we might add value to {company_ref}'s journey.\n\nBest regards,\n{sender_org}",
+    "consulting": "Hi {contact_ref},\n\nI noticed {company_ref} in the consulting field and thought there might be synergies with our work at {sender_org}. We specialize in helping consulting firms enhance their client value proposition. Would you be open to a brief conversation?\n\nBest regards,\n{sender_org}",
+    "ecommerce": "Hi {contact_ref},\n\nI discovered {company_ref} in the e-commerce space and was intrigued by your approach. {sender_org} works with e-commerce businesses to streamline their operations and drive growth. I'd be keen to learn more about your current challenges and see if there's alignment with our expertise.\n\nBest regards,\n{sender_org}",
+}
+
+_DEFAULT_INDUSTRY_TEMPLATE = "Hi {contact_ref},\n\nI came across {company_ref} in the {industry} space and thought there could be value in a brief conversation. We at {sender_org} work with companies like yours to explore growth and efficiency opportunities.\n\nBest regards,\n{sender_org}"
+
+_GENERIC_TEMPLATE = "Hi {contact_ref},\n\nI discovered {company_ref} and was interested in what you're building. At {sender_org}, we work with innovative companies to help them achieve their growth objectives. I'd love to learn more about your current initiatives and see if there's potential for collaboration.\n\nBest regards,\n{sender_org}"
+
+_WEBSITE_ONLY_TEMPLATE = "Hi team,\n\nI visited {website} and was impressed by {company_ref}'s work. At {sender_org}, we help companies like yours navigate growth challenges and operational efficiencies. I'd be interested in exploring potential synergies.\n\nBest regards,\n{sender_org}"
+
+
+@lru_cache(maxsize=512)
+def _norm_industry(industry: Optional[str]) -> str:
+    """
+    Normalize an industry label to its template lookup key.
+
+    Memoized because the same industry strings recur across leads and
+    repeated style calls for the same lead.
+    """
+    return (industry or "").lower().replace(" ", "")
+
 
 class MessageStyle(str, Enum):
     PROFESSIONAL = "professional"
@@ -28,19 +64,23 @@ class Messenger:
     def __init__(self):
         self.sender_org = os.getenv("SENDER_ORG", "Our Company")
         self.model_name = os.getenv("LLM_MODEL", "llama-3.3-70b-versatile")
+        # When LLM generation is disabled, the langchain import is never
+        # paid at all and every call goes straight to the templates
+        api_key = os.getenv("GROQ_API_KEY")
+        self._llm_enabled = bool(api_key) and api_key != "local_test_mode"
 
     def generate_message(self, lead: Lead) -> Optional[str]:
         """
         Generate a personalized outreach message based on available data
         """
-        start_time = time.time()
+        start_time = time.monotonic_ns()
 
-        # Check if we have enough data to generate a meaningful message
-        has_sufficient_data = self._has_sufficient_data(lead)
+        # Build the context once; every downstream step works off it
+        context = self._build_context(lead)
 
-        if has_sufficient_data:
+        if self._has_sufficient_data(context):
             # Try LLM-based generation
-            message = self._generate_llm_message(lead)
+            message = self._generate_llm_message(context)
             if message:
                 logger.info(
                     "LLM message generated successfully",
@@ -48,112 +88,221 @@ class Messenger:
                         "event": "message_generation",
                         "lead_id": lead.id,
                         "method": "llm",
-                        "processing_time_ms": int((time.time() - start_time) * 1000),
+                        "processing_time_ms": (time.monotonic_ns() - start_time)
+                        // 1_000_000,
                     },
                 )
                 return message
 
         # Fallback to template-based generation
-        message = self._generate_template_message(lead)
+        message = self._generate_template_message(context)
         logger.info(
             "Template message generated",
             extra={
                 "event": "message_generation",
                 "lead_id": lead.id,
                 "method": "template",
-                "processing_time_ms": int((time.time() - start_time) * 1000),
+                "processing_time_ms": (time.monotonic_ns() - start_time)
+                // 1_000_000,
             },
         )
         return message
 
-    def _has_sufficient_data(self, lead: Lead) -> bool:
+    def _has_sufficient_data(self, context: Dict[str, Any]) -> bool:
         """
         Check if we have enough data to generate a meaningful message
         """
         data_points = 0
 
-        if lead.company_name:
+        if context["has_company_name"]:
             data_points += 1
-        if lead.industry:
+        if context["has_industry"]:
             data_points += 1
-        if lead.about_text and len(lead.about_text) > 50:
+        if len(context["about_text"]) > 50:
             data_points += 1
-        if lead.contact_name:
+        if context["has_contact_name"]:
             data_points += 1
-        if lead.employees:
+        if context["employees"]:
             data_points += 1
 
         # Require at least 2 data points for meaningful personalization
         return data_points >= 2
 
-    def _generate_llm_message(self, lead: Lead) -> Optional[str]:
+    def _build_llm_chain(self, context: Dict[str, Any]):
         """
-        Generate message using LLM with data-locked prompts
+        Build the data-locked prompt/LLM chain for a lead context.
+
+        Returns the chain, or None when the LLM is unavailable
+        (missing dependency or API key).
         """
+        if not self._llm_enabled:
+            logger.warning(
+                "GROQ_API_KEY not set or in local test mode, skipping LLM message generation"
+            )
+            return None
+
+        # Import lazily so template-only deployments never pay for the
+        # langchain dependency tree
         try:
-            import os
             from langchain_groq import ChatGroq
             from langchain_core.prompts import ChatPromptTemplate
+        except ImportError:
+            logger.warning("LangChain not installed, skipping LLM message generation")
+            return None
 
-            # Only proceed if we have API key
-            api_key = os.getenv("GROQ_API_KEY")
-            if not api_key or api_key == "local_test_mode":
-                logger.warning(
-                    "GROQ_API_KEY not set or in local test mode, skipping LLM message generation"
-                )
-                return None
+        # Create prompt template
+        prompt = ChatPromptTemplate.from_messages(
+            [
+                ("system", self._get_system_prompt()),
+                ("human", self._get_human_prompt(context)),
+            ]
+        )
 
-            # Create a context-safe prompt that only uses available data
-            context = self._build_context(lead)
+        # Initialize LLM
+        llm = ChatGroq(
+            api_key=os.getenv("GROQ_API_KEY"),
+            model=self.model_name,
+            temperature=0.3,  # Low temperature to reduce hallucinations
+            max_tokens=200,
+        )
 
-            # Create prompt template
-            prompt = ChatPromptTemplate.from_messages(
-                [
-                    ("system", self._get_system_prompt()),
-                    ("human", self._get_human_prompt(context)),
-                ]
-            )
+        return prompt | llm
 
-            # Initialize LLM
-            llm = ChatGroq(
-                api_key=api_key,
-                model=self.model_name,
-                temperature=0.3,  # Low temperature to reduce hallucinations
-                max_tokens=200,
-            )
+    def _finalize_llm_response(self, response: Any, context: Dict[str, Any]) -> str:
+        """
+        Extract and validate the content of an LLM response
+        """
+        content = response.content if hasattr(response, "content") else str(response)
 
-            # Create chain and execute
-            chain = prompt | llm
-            response = chain.invoke({})
+        # Validate the response doesn't contain hallucinated information
+        validated_content = self._validate_response(content, context)
 
-            content = (
-                response.content if hasattr(response, "content") else str(response)
-            )
+        return validated_content.strip()
 
-            # Validate the response doesn't contain hallucinated information
-            validated_content = self._validate_response(content, context)
+    def _generate_llm_message(self, context: Dict[str, Any]) -> Optional[str]:
+        """
+        Generate message using LLM with data-locked prompts
+        """
+        try:
+            chain = self._build_llm_chain(context)
+            if chain is None:
+                return None
 
-            return validated_content.strip()
+            response = chain.invoke({})
 
-        except ImportError:
-            logger.warning("LangChain not installed, skipping LLM message generation")
+            return self._finalize_llm_response(response, context)
+
+        except Exception as e:
+            logger.error("LLM message generation failed: %s", e)
             return None
+
+    async def _generate_llm_message_async(self, context: Dict[str, Any]) -> Optional[str]:
+        """
+        Async variant of _generate_llm_message using langchain's ainvoke
+        """
+        try:
+            chain = self._build_llm_chain(context)
+            if chain is None:
+                return None
+
+            response = await chain.ainvoke({})
+
+            return self._finalize_llm_response(response, context)
+
         except Exception as e:
-            logger.error(f"LLM message generation failed: {str(e)}")
+            logger.error("LLM message generation failed: %s", e)
             return None
 
+    async def generate_message_async(self, lead: Lead) -> Optional[str]:
+        """
+        Async variant of generate_message, used for concurrent batch generation
+        """
+        start_time = time.monotonic_ns()
+
+        # Build the context once; every downstream step works off it
+        context = self._build_context(lead)
+
+        if self._has_sufficient_data(context):
+            # Try LLM-based generation
+            message = await self._generate_llm_message_async(context)
+            if message:
+                logger.info(
+                    "LLM message generated successfully",
+                    extra={
+                        "event": "message_generation",
+                        "lead_id": lead.id,
+                        "method": "llm",
+                        "processing_time_ms": (time.monotonic_ns() - start_time)
+                        // 1_000_000,
+                    },
+                )
+                return message
+
+        # Fallback to template-based generation
+        message = self._generate_template_message(context)
+        logger.info(
+            "Template message generated",
+            extra={
+                "event": "message_generation",
+                "lead_id": lead.id,
+                "method": "template",
+                "processing_time_ms": (time.monotonic_ns() - start_time)
+                // 1_000_000,
+            },
+        )
+        return message
+
+    async def generate_messages(self, leads: List[Lead]) -> List[Optional[str]]:
+        """
+        Generate messages for many leads concurrently.
+
+        LLM round-trips are network-bound, so firing them concurrently
+        completes a batch in roughly the latency of the slowest call
+        instead of the sum. Concurrency is bounded by LLM_MAX_CONCURRENCY.
+        """
+        semaphore = asyncio.Semaphore(int(os.getenv("LLM_MAX_CONCURRENCY", "8")))
+
+        async def _generate_one(lead: Lead) -> Optional[str]:
+            async with semaphore:
+                return await self.generate_message_async(lead)
+
+        return await asyncio.gather(*(_generate_one(lead) for lead in leads))
+
+    def generate_messages_sync(self, leads: List[Lead]) -> List[Optional[str]]:
+        """
+        Synchronous wrapper around generate_messages
+        """
+        return asyncio.run(self.generate_messages(leads))
+
     def _build_context(self, lead: Lead) -> Dict[str, Any]:
         """
-        Build context dictionary with available lead data
+        Build the context dictionary with available lead data.
+
+        Each lead attribute is read exactly once here; the sufficiency
+        check, the LLM prompt and the template fallbacks all work off
+        this dict instead of re-reading the ORM object.
         """
+        company_name = lead.company_name
+        industry = lead.industry
+        about_text = lead.about_text
+        contact_name = lead.contact_name
+        employees = lead.employees
+
         return {
-            "company_name": lead.company_name or "their company",
-            "industry": lead.industry or "their industry",
-            "about_text": lead.about_text or "",
-            "contact_name": lead.contact_name or "the team",
-            "employees": lead.employees or "",
+            "company_name": company_name or "their company",
+            "industry": industry or "their industry",
+            "about_text": about_text or "",
+            "contact_name": contact_name or "the team",
+            "employees": employees or "",
             "website": lead.website,
             "sender_org": self.sender_org,
+            # Derived values shared by the prompt and template paths
+            "has_company_name": bool(company_name),
+            "has_industry": bool(industry),
+            "has_contact_name": bool(contact_name),
+            "company_ref": company_name or "your company",
+            "contact_ref": contact_name or "the team",
+            "industry_key": _norm_industry(industry),
         }
 
     def _get_system_prompt(self) -> str:
@@ -212,56 +361,52 @@ class Messenger:
 
         return validated_response
 
-    def _generate_template_message(self, lead: Lead) -> str:
+    def _generate_template_message(self, context: Dict[str, Any]) -> str:
         """
         Generate message using template fallback when LLM is unavailable
         or insufficient data exists
         """
         # Use company-specific templates based on available data
-        if lead.company_name and lead.industry:
-            return self._get_industry_template(lead)
-        elif lead.company_name:
-            return self._get_generic_template(lead)
+        if context["has_company_name"] and context["has_industry"]:
+            return self._get_industry_template(context)
+        elif context["has_company_name"]:
+            return self._get_generic_template(context)
         else:
-            return self._get_website_only_template(lead)
+            return self._get_website_only_template(context)
 
-    def _get_industry_template(self, lead: Lead) -> str:
+    def _get_industry_template(self, context: Dict[str, Any]) -> str:
         """
         Get industry-specific template
         """
-        contact_ref = lead.contact_name or "the team"
-        company_ref = lead.company_name or "your company"
-
-        templates = {
-            "software": f"Hi {contact_ref},\n\nI came across {company_ref} in the software space and was impressed by your work. At {self.sender_org}, we help software companies optimize their operations and growth. I'd love to explore how we might add value to {company_ref}'s journey.\n\nBest regards,\n{self.sender_org}",
-            "consulting": f"Hi {contact_ref},\n\nI noticed {company_ref} in the consulting field and thought there might be synergies with our work at {self.sender_org}. We specialize in helping consulting firms enhance their client value proposition. Would you be open to a brief conversation?\n\nBest regards,\n{self.sender_org}",
-            "ecommerce": f"Hi {contact_ref},\n\nI discovered {company_ref} in the e-commerce space and was intrigued by your approach. {self.sender_org} works with e-commerce businesses to streamline their operations and drive growth. I'd be keen to learn more about your current challenges and see if there's alignment with our expertise.\n\nBest regards,\n{self.sender_org}",
-        }
-
-        industry_key = (lead.industry or "").lower().replace(" ", "")
-        if industry_key in templates:
-            return templates[industry_key]
-
-        # Default template
-        return f"Hi {contact_ref},\n\nI came across {company_ref} in the {lead.industry} space and thought there could be value in a brief conversation. We at {self.sender_org} work with companies like yours to explore growth and efficiency opportunities.\n\nBest regards,\n{self.sender_org}"
+        template = _INDUSTRY_TEMPLATES.get(
+            context["industry_key"], _DEFAULT_INDUSTRY_TEMPLATE
+        )
+        return template.format(
+            contact_ref=context["contact_ref"],
+            company_ref=context["company_ref"],
+            industry=context["industry"],
+            sender_org=self.sender_org,
+        )
 
-    def _get_generic_template(self, lead: Lead) -> str:
+    def _get_generic_template(self, context: Dict[str, Any]) -> str:
         """
         Get generic template when only company name is available
         """
-        contact_ref = lead.contact_name or "the team"
-        company_ref = lead.company_name or "your company"
-
-        return f"Hi {contact_ref},\n\nI discovered {company_ref} and was interested in what you're building. At {self.sender_org}, we work with innovative companies to help them achieve their growth objectives. I'd love to learn more about your current initiatives and see if there's potential for collaboration.\n\nBest regards,\n{self.sender_org}"
+        return _GENERIC_TEMPLATE.format(
+            contact_ref=context["contact_ref"],
+            company_ref=context["company_ref"],
+            sender_org=self.sender_org,
+        )
 
-    def _get_website_only_template(self, lead: Lead) -> str:
+    def _get_website_only_template(self, context: Dict[str, Any]) -> str:
         """
         Get template when only website is available
         """
-        website = lead.website or "your website"
-        company_ref = lead.company_name or "your company"
-
-        return f"Hi team,\n\nI visited {website} and was impressed by {company_ref}'s work. At {self.sender_org}, we help companies like yours navigate growth challenges and operational efficiencies. I'd be interested in exploring potential synergies.\n\nBest regards,\n{self.sender_org}"
+        return _WEBSITE_ONLY_TEMPLATE.format(
+            website=context["website"] or "your website",
+            company_ref=context["company_ref"],
+            sender_org=self.sender_org,
+        )
 
     def generate_message_with_style(self, lead: Lead, style: MessageStyle) -> str:
         """
@@ -283,7 +428,7 @@ class Messenger:
         Make message more professional
         """
         # Ensure formal tone
-        message = message.replace("Hi ", "Dear ")
+        message = _PRO_RE.sub("Dear ", message)
         if "Best regards," not in message:
             message += f"\n\nBest regards,\n{self.sender_org}"
         return message
@@ -292,11 +437,8 @@ class Messenger:
         """
         Make message more friendly
         """
-        # Ensure friendly tone
-        message = message.replace("Dear ", "Hi ")
-        if "Best regards," in message:
-            message = message.replace("Best regards,", "Cheers,")
-        return message
+        # Ensure friendly tone; both substitutions happen in a single pass
+        return _FRIEND_RE.sub(lambda m: _FRIEND_SUBS[m.group(0)], message)
 
     def _make_short(self, message: str) -> str:
         """
@@ -3,21 +3,97 @@ Advanced scraping infrastructure with tiered approach
 """
 
 import asyncio
+import atexit
 import json
 import re
 import time
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, Optional, List, Any
-from urllib.parse import urlparse, urljoin
+from urllib.parse import urlparse
 import aiohttp
 from bs4 import BeautifulSoup
 from playwright.async_api import async_playwright
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 
 from core.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Prefer the lxml (libxml2 C binding) parser for BeautifulSoup; it parses
+# 5-10x faster than the pure-Python html.parser. Fall back gracefully on
+# platforms without lxml wheels.
+try:
+    import lxml  # noqa: F401
+
+    _BS_PARSER = "lxml"
+except ImportError:
+    _BS_PARSER = "html.parser"
+
+# Prefer selectolax's Lexbor engine for Tier-2 meta extraction: it
+# traverses in C without allocating a Python object per tag. Optional,
+# with the BeautifulSoup path kept as the fallback.
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Prefer orjson's native decoder for JSON-LD blobs (several times faster
+# than the stdlib on large payloads); fall back to json when absent.
+# Both decoders raise ValueError subclasses on bad input.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Per-host politeness limits: bounded concurrency plus a minimum spacing
+# between consecutive requests, so target hosts don't answer with 429s or
+# connection resets that waste time on retries
+_PER_HOST_CONCURRENCY = 8
+_MIN_REQUEST_INTERVAL = 0.5  # seconds between requests to the same host
+
+# Patterns used on every scrape, compiled once at import
+_OG_RE = re.compile(r"^og:")
+_TW_RE = re.compile(r"^twitter:")
+_LINKEDIN_HREF_RE = re.compile(r"linkedin\.com", re.IGNORECASE)
+_EMAIL_RE = re.compile(
+    r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", re.IGNORECASE
+)
+_PHONE_RE = re.compile(r"\+?\d{1,2}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}")
+
+# Default headers for the plain HTTP tiers: advertise compression so
+# servers send gzip/deflate/brotli instead of raw HTML
+_DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Encoding": "gzip, deflate, br",
+}
+
+# Hard cap on fetched body size; pathological pages past this point are
+# truncated rather than parsed (or OOMing a worker) in full
+_MAX_BODY_BYTES = 2_000_000
+
+# Upper bound on cached conditional-GET entries per scraper instance
+_CACHE_MAX_ENTRIES = 10_000
+
+# urlparse pays a parse + namedtuple per call and the same URLs recur
+# constantly (per-host limiting, domain extraction); memoize it
+_parse_url = lru_cache(maxsize=4096)(urlparse)
+
+# Pre-pass matcher for JSON-LD script blocks; finds them in one linear
+# scan of the raw HTML so the happy path skips building a DOM entirely
+_JSONLD_RE = re.compile(
+    r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>',
+    re.DOTALL | re.IGNORECASE,
+)
+
 
 class ScrapingMethod(str, Enum):
     JSON_LD = "json_ld"
@@ -47,17 +123,146 @@ class TieredScraper:
         self.timeout = timeout
         self.max_retries = max_retries
         self.session = None
+        # Per-host rate limiting state
+        self._host_sems: Dict[str, asyncio.Semaphore] = {}
+        self._host_last: Dict[str, float] = {}
+        # Conditional-GET cache: url -> (etag, last_modified, result),
+        # LRU-evicted once it grows past _CACHE_MAX_ENTRIES
+        self._cache: "OrderedDict[str, tuple]" = OrderedDict()
+        # Shared Playwright runtime and browser, launched lazily; the
+        # lock keeps concurrent Tier-3 fallbacks from racing the launch
+        # and leaking extra Chromium processes
+        self._pw = None
+        self._browser = None
+        self._browser_lock = asyncio.Lock()
+
+    async def _request_with_limits(self, url: str, headers: Optional[Dict[str, str]] = None):
+        """
+        Issue a GET with per-host concurrency and rate limits.
 
-    async def __aenter__(self):
-        if self.session is None:
+        Concurrency per host is bounded by a semaphore, consecutive
+        requests to the same host are spaced by a minimum interval, and
+        429/5xx responses are retried with exponential backoff.
+
+        Returns an (http_status, body_text, response_headers) tuple.
+        """
+        host = _parse_url(url).netloc
+        sem = self._host_sems.setdefault(
+            host, asyncio.Semaphore(_PER_HOST_CONCURRENCY)
+        )
+
+        status = 0
+        delay = 1.0
+        for attempt in range(self.max_retries + 1):
+            async with sem:
+                wait = _MIN_REQUEST_INTERVAL - (
+                    time.monotonic() - self._host_last.get(host, 0.0)
+                )
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self._host_last[host] = time.monotonic()
+
+                async with self.session.get(
+                    url, headers=headers or _DEFAULT_HEADERS
+                ) as response:
+                    status = response.status
+                    if status != 429 and status < 500:
+                        # Stream with a byte cap so a single huge page
+                        # can't exhaust memory or starve the event loop
+                        chunks = []
+                        size = 0
+                        async for chunk in response.content.iter_chunked(65536):
+                            chunks.append(chunk)
+                            size += len(chunk)
+                            if size > _MAX_BODY_BYTES:
+                                break
+                        raw = b"".join(chunks)
+                        try:
+                            text = raw.decode(response.get_encoding(), errors="replace")
+                        except (LookupError, RuntimeError):
+                            text = raw.decode("utf-8", errors="replace")
+                        return status, text, response.headers
+
+            # Rate-limited or server error: back off before retrying
+            if attempt < self.max_retries:
+                await asyncio.sleep(delay)
+                delay *= 2
+
+        return status, "", {}
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """
+        Lazily create (or recreate) the shared HTTP session.
+
+        The session is long-lived so TCP connections and TLS handshakes
+        are reused across scrapes instead of being paid per URL.
+        """
+        if self.session is None or self.session.closed:
             self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self.timeout)
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=64,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                ),
+            )
+        return self.session
+
+    async def _ensure_browser(self):
+        """
+        Lazily start Playwright and launch a single shared browser.
+
+        Chromium startup costs seconds, so the browser stays alive and
+        is reused across Tier-3 scrapes; each URL still gets a fresh
+        context for isolation. The lock makes concurrent callers wait
+        for one launch instead of each starting their own browser.
+        """
+        if self._browser is not None and self._browser.is_connected():
+            return self._browser
+        async with self._browser_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return self._browser
+            if self._pw is None:
+                self._pw = await async_playwright().start()
+            self._browser = await self._pw.chromium.launch(
+                headless=True,
+                args=[
+                    "--disable-blink-features=AutomationControlled",
+                    "--no-sandbox",
+                    "--disable-dev-shm-usage",
+                    "--disable-infobars",
+                    "--disable-extensions",
+                    "--disable-plugins",
+                ],
             )
+        return self._browser
+
+    async def close(self):
+        """Release the shared HTTP session and browser"""
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+        if self._pw is not None:
+            try:
+                await self._pw.stop()
+            except Exception:
+                pass
+            self._pw = None
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+    async def __aenter__(self):
+        await self._ensure_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        # The session is intentionally kept open so it can be reused by
+        # subsequent scrapes; call close() explicitly on shutdown.
+        return None
 
     async def scrape(self, url: str) -> ScrapingResult:
         """
@@ -68,99 +273,201 @@ class TieredScraper:
         """
         start_time = time.time()
 
-        # Tier 1: JSON-LD extraction (highest confidence, most reliable)
-        result = await self._extract_json_ld(url)
-        if result.success and result.confidence > 0.7:
-            result.processing_time = time.time() - start_time
-            return result
-
-        # Tier 2: Meta tags and structured data
-        result = await self._extract_meta_data(url)
-        if result.success and result.confidence > 0.5:
-            result.processing_time = time.time() - start_time
-            return result
+        await self._ensure_session()
+
+        # Revalidate cached results cheaply: if we've scraped this URL
+        # before and the server gave validators, ask for a 304 instead
+        # of the full body
+        cached = self._cache.get(url)
+        cond_headers = None
+        if cached is not None:
+            etag, last_modified, _cached_result = cached
+            cond_headers = dict(_DEFAULT_HEADERS)
+            if etag:
+                cond_headers["If-None-Match"] = etag
+            if last_modified:
+                cond_headers["If-Modified-Since"] = last_modified
+
+        # Fetch the page once; both structured-data tiers run over the
+        # same document instead of refetching per tier
+        content = None
+        resp_headers: Dict[str, str] = {}
+        try:
+            status, content, resp_headers = await self._request_with_limits(
+                url, headers=cond_headers
+            )
+            if status == 304 and cached is not None:
+                self._cache.move_to_end(url)
+                return replace(
+                    cached[2], processing_time=time.time() - start_time
+                )
+            if status != 200:
+                logger.error(f"Fetch failed for {url}: HTTP {status}")
+                content = None
+        except Exception as e:
+            logger.error(f"Fetch failed for {url}: {str(e)}")
+
+        if content is not None:
+            # Tier 1: JSON-LD extraction (highest confidence, most
+            # reliable). Try the regex pre-pass first so the common
+            # JSON-LD-present case never builds a DOM; the parsed tree
+            # is built lazily only for the soup-based paths.
+            soup = None
+            result = self._json_ld_from_html(content)
+            if result is None:
+                soup = BeautifulSoup(content, _BS_PARSER)
+                result = self._json_ld_from_soup(soup)
+            if result.success and result.confidence > 0.7:
+                result.processing_time = time.time() - start_time
+                self._cache_store(url, resp_headers, result)
+                return result
+
+            # Tier 2: Meta tags and structured data
+            if LexborHTMLParser is not None:
+                result = self._meta_from_html(content, url)
+            else:
+                if soup is None:
+                    soup = BeautifulSoup(content, _BS_PARSER)
+                result = self._meta_from_soup(soup, url)
+            if result.success and result.confidence > 0.5:
+                result.processing_time = time.time() - start_time
+                self._cache_store(url, resp_headers, result)
+                return result
 
         # Tier 3: Playwright for JavaScript-heavy sites (fallback)
         result = await self._scrape_with_playwright(url)
         result.processing_time = time.time() - start_time
         return result
 
-    async def _extract_json_ld(self, url: str) -> ScrapingResult:
-        """Extract structured data from JSON-LD scripts"""
+    async def scrape_many(
+        self, urls: List[str], concurrency: int = 64
+    ) -> List[Any]:
+        """
+        Scrape a batch of URLs concurrently.
+
+        Runs up to `concurrency` scrapes in flight at once so network
+        waits overlap instead of serializing; the per-host limits still
+        apply underneath, so a batch full of one domain stays polite.
+        Returns results in input order; failures surface as exceptions
+        in the corresponding slot rather than aborting the batch.
+        """
+        await self._ensure_session()
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one(u: str) -> ScrapingResult:
+            async with sem:
+                return await self.scrape(u)
+
+        return await asyncio.gather(
+            *(_one(u) for u in urls), return_exceptions=True
+        )
+
+    def _cache_store(
+        self, url: str, resp_headers: Dict[str, str], result: ScrapingResult
+    ) -> None:
+        """
+        Remember a successful result alongside its cache validators.
+
+        Only responses that carry an ETag or Last-Modified are cached,
+        since without a validator there's nothing to revalidate against.
+        """
+        etag = resp_headers.get("ETag")
+        last_modified = resp_headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        self._cache[url] = (etag, last_modified, result)
+        self._cache.move_to_end(url)
+        while len(self._cache) > _CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+
+    def _json_ld_from_html(self, content: str) -> Optional[ScrapingResult]:
+        """
+        Extract JSON-LD blocks from raw HTML with a single regex pass.
+
+        Returns a ScrapingResult when usable data was found, or None to
+        signal the caller to fall back to the full BeautifulSoup path
+        (no matches, or none of the blocks parsed as JSON).
+        """
+        try:
+            all_data = {}
+            for blob in _JSONLD_RE.findall(content):
+                try:
+                    json_data = _json_loads(blob)
+                except ValueError:
+                    continue
+                if isinstance(json_data, list):
+                    for item in json_data:
+                        all_data.update(self._flatten_json(item))
+                else:
+                    all_data.update(self._flatten_json(json_data))
+
+            if not all_data:
+                return None
+
+            return ScrapingResult(
+                success=True,
+                data=all_data,
+                method=ScrapingMethod.JSON_LD,
+                confidence=self._calculate_json_ld_confidence(all_data),
+                processing_time=0.0,  # Will be updated by parent
+            )
+        except Exception as e:
+            logger.error(f"JSON-LD pre-pass failed: {str(e)}")
+            return None
+
+    def _json_ld_from_soup(self, soup: BeautifulSoup) -> ScrapingResult:
+        """Extract structured data from JSON-LD scripts in a parsed page"""
         try:
-            if self.session is None:
+            # Find JSON-LD scripts
+            json_ld_scripts = soup.find_all("script", type="application/ld+json")
+
+            if not json_ld_scripts:
                 return ScrapingResult(
                     success=False,
                     data={},
                     method=ScrapingMethod.JSON_LD,
                     confidence=0.0,
                     processing_time=0.0,
-                    error_message="Session is not initialized",
+                    error_message="No JSON-LD found",
                 )
 
-            async with self.session.get(url) as response:
-                if response.status != 200:
-                    return ScrapingResult(
-                        success=False,
-                        data={},
-                        method=ScrapingMethod.JSON_LD,
-                        confidence=0.0,
-                        processing_time=0.0,
-                        error_message=f"HTTP {response.status}",
-                    )
-
-                content = await response.text()
-                soup = BeautifulSoup(content, "html.parser")
-
-                # Find JSON-LD scripts
-                json_ld_scripts = soup.find_all("script", type="application/ld+json")
-
-                if not json_ld_scripts:
-                    return ScrapingResult(
-                        success=False,
-                        data={},
-                        method=ScrapingMethod.JSON_LD,
-                        confidence=0.0,
-                        processing_time=0.0,
-                        error_message="No JSON-LD found",
-                    )
-
-                # Parse all JSON-LD data
-                all_data = {}
-                for script in json_ld_scripts:
-                    try:
-                        json_data = json.loads(script.string)
-                        if isinstance(json_data, list):
-                            for item in json_data:
-                                all_data.update(self._flatten_json(item))
-                        else:
-                            all_data.update(self._flatten_json(json_data))
-                    except json.JSONDecodeError:
-                        continue
-
-                if not all_data:
-                    return ScrapingResult(
-                        success=False,
-                        data={},
-                        method=ScrapingMethod.JSON_LD,
-                        confidence=0.0,
-                        processing_time=0.0,
-                        error_message="Invalid JSON-LD",
-                    )
-
-                # Calculate confidence based on data completeness
-                confidence = self._calculate_json_ld_confidence(all_data)
+            # Parse all JSON-LD data
+            all_data = {}
+            for script in json_ld_scripts:
+                try:
+                    json_data = _json_loads(script.string)
+                    if isinstance(json_data, list):
+                        for item in json_data:
+                            all_data.update(self._flatten_json(item))
+                    else:
+                        all_data.update(self._flatten_json(json_data))
+                except (ValueError, TypeError):
+                    continue
 
+            if not all_data:
                 return ScrapingResult(
-                    success=True,
-                    data=all_data,
+                    success=False,
+                    data={},
                     method=ScrapingMethod.JSON_LD,
-                    confidence=confidence,
-                    processing_time=0.0,  # Will be updated by parent
+                    confidence=0.0,
+                    processing_time=0.0,
+                    error_message="Invalid JSON-LD",
                 )
 
+            # Calculate confidence based on data completeness
+            confidence = self._calculate_json_ld_confidence(all_data)
+
+            return ScrapingResult(
+                success=True,
+                data=all_data,
+                method=ScrapingMethod.JSON_LD,
+                confidence=confidence,
+                processing_time=0.0,  # Will be updated by parent
+            )
+
         except Exception as e:
-            logger.error(f"JSON-LD extraction failed for {url}: {str(e)}")
+            logger.error(f"JSON-LD extraction failed: {str(e)}")
             return ScrapingResult(
                 success=False,
                 data={},
@@ -170,93 +477,183 @@ class TieredScraper:
                 error_message=str(e),
             )
 
-    async def _extract_meta_data(self, url: str) -> ScrapingResult:
-        """Extract meta tags, title, and basic structured data"""
+    def _meta_from_html(self, content: str, url: str) -> ScrapingResult:
+        """
+        Extract meta tags, title, and links with the Lexbor parser.
+
+        Mirrors _meta_from_soup but runs entirely in C-native traversal,
+        which is several times faster than BeautifulSoup for the handful
+        of selectors the meta tier needs.
+        """
         try:
-            if self.session is None:
+            tree = LexborHTMLParser(content)
+            data = {}
+
+            # Title
+            title_node = tree.css_first("title")
+            if title_node:
+                data["title"] = title_node.text().strip()
+
+            # Meta description
+            desc_node = tree.css_first("meta[name='description']")
+            if desc_node:
+                data["description"] = (
+                    desc_node.attributes.get("content") or ""
+                ).strip()
+
+            # Open Graph tags
+            for tag in tree.css("meta[property^='og:']"):
+                prop = (tag.attributes.get("property") or "").replace("og:", "")
+                if prop:
+                    data[f"og_{prop}"] = (
+                        tag.attributes.get("content") or ""
+                    ).strip()
+
+            # Twitter Card tags
+            for tag in tree.css("meta[name^='twitter:']"):
+                name = (tag.attributes.get("name") or "").replace("twitter:", "")
+                if name:
+                    data[f"twitter_{name}"] = (
+                        tag.attributes.get("content") or ""
+                    ).strip()
+
+            # Links: same lazy, capped walk as the soup path. LinkedIn
+            # anchors are collected up front with a targeted selector so
+            # the orchestrator's linkedin_url extraction still works when
+            # the walk is skipped or its cap cuts off the footer.
+            links = []
+            for node in tree.css('a[href*="linkedin.com"]'):
+                href = node.attributes.get("href") or ""
+                if href[:4] == "http":
+                    links.append(href)
+            data["links"] = links
+            confidence = self._calculate_meta_confidence(data)
+            if confidence < 0.5:
+                # Parse the base URL once; absolutizing "/path" links is
+                # then plain concatenation instead of urljoin's re-parse
+                base = _parse_url(url)
+                base_prefix = f"{base.scheme}://{base.netloc}"
+                append = links.append
+                for node in tree.css("a[href]"):
+                    href = node.attributes.get("href") or ""
+                    if href[:4] == "http":
+                        if href not in links:
+                            append(href)
+                    elif href[:1] == "/":
+                        append(base_prefix + href)
+                    if len(links) >= 50:
+                        break
+                confidence = self._calculate_meta_confidence(data)
+
+            if not data:
                 return ScrapingResult(
                     success=False,
                     data={},
                     method=ScrapingMethod.STRUCTURED_DATA,
                     confidence=0.0,
                     processing_time=0.0,
-                    error_message="Session is not initialized",
+                    error_message="No meta data found",
                 )
 
-            async with self.session.get(url) as response:
-                if response.status != 200:
-                    return ScrapingResult(
-                        success=False,
-                        data={},
-                        method=ScrapingMethod.STRUCTURED_DATA,
-                        confidence=0.0,
-                        processing_time=0.0,
-                        error_message=f"HTTP {response.status}",
-                    )
-
-                content = await response.text()
-                soup = BeautifulSoup(content, "html.parser")
-
-                # Extract basic information
-                data = {}
+            return ScrapingResult(
+                success=True,
+                data=data,
+                method=ScrapingMethod.STRUCTURED_DATA,
+                confidence=confidence,
+                processing_time=0.0,  # Will be updated by parent
+            )
 
-                # Title
-                title_tag = soup.find("title")
-                if title_tag:
-                    data["title"] = title_tag.get_text().strip()
+        except Exception as e:
+            logger.error(f"Meta data extraction failed for {url}: {str(e)}")
+            return ScrapingResult(
+                success=False,
+                data={},
+                method=ScrapingMethod.STRUCTURED_DATA,
+                confidence=0.0,
+                processing_time=0.0,
+                error_message=str(e),
+            )
 
-                # Meta description
-                desc_tag = soup.find("meta", attrs={"name": "description"})
-                if desc_tag:
-                    data["description"] = desc_tag.get("content", "").strip()
+    def _meta_from_soup(self, soup: BeautifulSoup, url: str) -> ScrapingResult:
+        """Extract meta tags, title, and basic structured data from a parsed page"""
+        try:
+            # Extract basic information
+            data = {}
 
-                # Open Graph tags
-                og_tags = soup.find_all("meta", property=re.compile(r"^og:"))
-                for tag in og_tags:
-                    prop = tag.get("property", "").replace("og:", "")
-                    if prop:
-                        data[f"og_{prop}"] = tag.get("content", "").strip()
+            # Title
+            title_tag = soup.find("title")
+            if title_tag:
+                data["title"] = title_tag.get_text().strip()
 
-                # Twitter Card tags
-                twitter_tags = soup.find_all(
-                    "meta", attrs={"name": re.compile(r"^twitter:")}
-                )
-                for tag in twitter_tags:
-                    name = tag.get("name", "").replace("twitter:", "")
-                    if name:
-                        data[f"twitter_{name}"] = tag.get("content", "").strip()
+            # Meta description
+            desc_tag = soup.find("meta", attrs={"name": "description"})
+            if desc_tag:
+                data["description"] = desc_tag.get("content", "").strip()
 
-                # Links
-                links = []
+            # Open Graph tags
+            og_tags = soup.find_all("meta", property=_OG_RE)
+            for tag in og_tags:
+                prop = tag.get("property", "").replace("og:", "")
+                if prop:
+                    data[f"og_{prop}"] = tag.get("content", "").strip()
+
+            # Twitter Card tags
+            twitter_tags = soup.find_all("meta", attrs={"name": _TW_RE})
+            for tag in twitter_tags:
+                name = tag.get("name", "").replace("twitter:", "")
+                if name:
+                    data[f"twitter_{name}"] = tag.get("content", "").strip()
+
+            # Links: walking every <a href> dominates parse time on large
+            # pages, but scoring only checks that some links exist. Skip
+            # the walk when the meta tags alone already clear the tier-2
+            # threshold, and cap it at 50 qualifying links otherwise.
+            # LinkedIn anchors are collected up front with a targeted
+            # lookup so the orchestrator's linkedin_url extraction still
+            # works when the walk is skipped or its cap cuts off the
+            # footer.
+            links = []
+            for link in soup.find_all("a", href=_LINKEDIN_HREF_RE):
+                href = link["href"]
+                if href[:4] == "http":
+                    links.append(href)
+            data["links"] = links
+            confidence = self._calculate_meta_confidence(data)
+            if confidence < 0.5:
+                # Parse the base URL once; absolutizing "/path" links is
+                # then plain concatenation instead of urljoin's re-parse
+                base = _parse_url(url)
+                base_prefix = f"{base.scheme}://{base.netloc}"
+                append = links.append
                 for link in soup.find_all("a", href=True):
                     href = link["href"]
-                    if href.startswith(("http://", "https://")):
-                        links.append(href)
-                    elif href.startswith("/"):
-                        links.append(urljoin(url, href))
-                data["links"] = links
-
-                # Calculate confidence based on available data
+                    if href[:4] == "http":
+                        if href not in links:
+                            append(href)
+                    elif href[:1] == "/":
+                        append(base_prefix + href)
+                    if len(links) >= 50:
+                        break
                 confidence = self._calculate_meta_confidence(data)
 
-                if not data:
-                    return ScrapingResult(
-                        success=False,
-                        data={},
-                        method=ScrapingMethod.STRUCTURED_DATA,
-                        confidence=0.0,
-                        processing_time=0.0,
-                        error_message="No meta data found",
-                    )
-
+            if not data:
                 return ScrapingResult(
-                    success=True,
-                    data=data,
+                    success=False,
+                    data={},
                     method=ScrapingMethod.STRUCTURED_DATA,
-                    confidence=confidence,
-                    processing_time=0.0,  # Will be updated by parent
+                    confidence=0.0,
+                    processing_time=0.0,
+                    error_message="No meta data found",
                 )
 
+            return ScrapingResult(
+                success=True,
+                data=data,
+                method=ScrapingMethod.STRUCTURED_DATA,
+                confidence=confidence,
+                processing_time=0.0,  # Will be updated by parent
+            )
+
         except Exception as e:
             logger.error(f"Meta data extraction failed for {url}: {str(e)}")
             return ScrapingResult(
@@ -284,62 +681,66 @@ class TieredScraper:
                     error_message="Playwright not installed",
                 )
 
-            async with async_playwright() as p:
-                try:
-                    browser = await p.chromium.launch(
-                        headless=True,
-                        args=[
-                            "--disable-blink-features=AutomationControlled",
-                            "--no-sandbox",
-                            "--disable-dev-shm-usage",
-                            "--disable-infobars",
-                            "--disable-extensions",
-                            "--disable-plugins",
-                            "--disable-images",  # Speed up by not loading images
-                        ],
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Playwright browser launch failed for {url}: {str(e)}"
-                    )
-                    # Check if this is a Windows/Python compatibility issue
-                    if (
-                        "NotImplementedError" in str(e)
-                        or "subprocess" in str(e).lower()
-                    ):
-                        # Try alternative scraping method for Windows compatibility
-                        return await self._scrape_with_requests_fallback(url)
-                    else:
-                        return ScrapingResult(
-                            success=False,
-                            data={},
-                            method=ScrapingMethod.PLAYWRIGHT,
-                            confidence=0.0,
-                            processing_time=0.0,
-                            error_message=f"Browser launch failed: {str(e)}",
-                        )
-
-                context = await browser.new_context(
-                    user_agent=(
-                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                        "AppleWebKit/537.36 (KHTML, like Gecko) "
-                        "Chrome/120.0.0.0 Safari/537.36"
-                    ),
-                    viewport={"width": 1366, "height": 768},
-                    locale="en-US",
-                    extra_http_headers={
-                        "Accept-Language": "en-US,en;q=0.9",
-                        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                    },
+            try:
+                browser = await self._ensure_browser()
+            except Exception as e:
+                logger.error(
+                    f"Playwright browser launch failed for {url}: {str(e)}"
                 )
+                # Check if this is a Windows/Python compatibility issue
+                if (
+                    "NotImplementedError" in str(e)
+                    or "subprocess" in str(e).lower()
+                ):
+                    # Try alternative scraping method for Windows compatibility
+                    return await self._scrape_with_requests_fallback(url)
+                else:
+                    return ScrapingResult(
+                        success=False,
+                        data={},
+                        method=ScrapingMethod.PLAYWRIGHT,
+                        confidence=0.0,
+                        processing_time=0.0,
+                        error_message=f"Browser launch failed: {str(e)}",
+                    )
+
+            # Fresh context per URL for isolation; the browser itself is
+            # shared and stays alive across scrapes
+            context = await browser.new_context(
+                user_agent=(
+                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                    "AppleWebKit/537.36 (KHTML, like Gecko) "
+                    "Chrome/120.0.0.0 Safari/537.36"
+                ),
+                viewport={"width": 1366, "height": 768},
+                locale="en-US",
+                extra_http_headers={
+                    "Accept-Language": "en-US,en;q=0.9",
+                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+                },
+            )
+
+            # Abort heavy resource types at the network layer; modern
+            # headless Chromium ignores --disable-images, and images,
+            # fonts and stylesheets are most of the bytes on a typical
+            # page while contributing nothing to extraction
+            await context.route(
+                "**/*",
+                lambda route: (
+                    route.abort()
+                    if route.request.resource_type
+                    in {"image", "font", "media", "stylesheet"}
+                    else route.continue_()
+                ),
+            )
 
+            try:
                 page = await context.new_page()
 
                 # Navigate to the page
                 response = await page.goto(url, wait_until="domcontentloaded")
 
                 if response and response.status != 200:
-                    await browser.close()
                     return ScrapingResult(
                         success=False,
                         data={},
@@ -349,8 +750,18 @@ class TieredScraper:
                         error_message=f"HTTP {response.status}",
                     )
 
-                # Wait for page to load and render
-                await page.wait_for_timeout(3000)  # Wait for React/Vue to render
+                # Wait for content instead of sleeping a fixed 3s: proceed
+                # as soon as structured data or meaningful body text shows
+                # up, with the old 3s as the upper bound
+                try:
+                    await page.wait_for_function(
+                        "document.querySelectorAll('script[type=\"application/ld+json\"]').length > 0"
+                        " || document.body.innerText.length > 500",
+                        timeout=3000,
+                    )
+                except Exception:
+                    # Page never got there in time; extract what rendered
+                    pass
 
                 # Execute JavaScript to extract structured data
                 data = await page.evaluate(
@@ -369,13 +780,11 @@ class TieredScraper:
                         const ogDesc = document.querySelector("meta[property='og:description']");
                         result.og_description = ogDesc?.content || null;
                         
-                        // JSON-LD structured data
-                        result.jsonld = Array.from(
+                        // JSON-LD structured data: returned as raw strings
+                        // and parsed once on the Python side
+                        result.jsonld_raw = Array.from(
                             document.querySelectorAll("script[type='application/ld+json']")
-                        ).map(s => {
-                            try { return JSON.parse(s.innerText); }
-                            catch { return null; }
-                        }).filter(Boolean);
+                        ).map(s => s.innerText);
                         
                         // Visible text content
                         result.text_content = document.body.innerText.slice(0, 8000);
@@ -385,13 +794,13 @@ class TieredScraper:
                             .map(a => a.href)
                             .filter(href => href && href.startsWith('http'));
                         
-                        // Contact info patterns
-                        const text = result.text_content.toLowerCase();
-                        const emailPattern = /([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})/;
+                        // Contact info patterns: case-insensitive flags
+                        // instead of lowercasing the whole text slice
+                        const emailPattern = /([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})/i;
                         const phonePattern = /(\+?\d{1,2}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})/;
-                        
-                        const emailMatch = text.match(emailPattern);
-                        const phoneMatch = text.match(phonePattern);
+
+                        const emailMatch = result.text_content.match(emailPattern);
+                        const phoneMatch = result.text_content.match(phonePattern);
                         
                         result.email = emailMatch ? emailMatch[1] : null;
                         result.phone = phoneMatch ? phoneMatch[1] : null;
@@ -405,7 +814,17 @@ class TieredScraper:
                 """
                 )
 
-                await browser.close()
+                if data:
+                    # Decode JSON-LD once here instead of JSON.parse in
+                    # V8 plus a second serialization across the CDP
+                    # boundary
+                    jsonld = []
+                    for blob in data.pop("jsonld_raw", None) or []:
+                        try:
+                            jsonld.append(_json_loads(blob))
+                        except (ValueError, TypeError):
+                            continue
+                    data["jsonld"] = jsonld
 
                 if not data:
                     return ScrapingResult(
@@ -427,6 +846,8 @@ class TieredScraper:
                     confidence=confidence,
                     processing_time=0.0,  # Will be updated by parent
                 )
+            finally:
+                await context.close()
 
         except Exception as e:
             logger.error(f"Playwright scraping failed for {url}: {str(e)}")
@@ -447,25 +868,36 @@ class TieredScraper:
     def _flatten_json(
         self, obj: Any, parent_key: str = "", sep: str = "_"
     ) -> Dict[str, Any]:
-        """Flatten nested JSON structure"""
-        items = []
-
-        if isinstance(obj, dict):
-            for k, v in obj.items():
-                new_key = f"{parent_key}{sep}{k}" if parent_key else k
-                if isinstance(v, (dict, list)):
-                    items.extend(self._flatten_json(v, new_key, sep=sep).items())
-                else:
-                    items.append((new_key, v))
-        elif isinstance(obj, list):
-            for i, v in enumerate(obj):
-                new_key = f"{parent_key}{sep}{i}" if parent_key else str(i)
-                if isinstance(v, (dict, list)):
-                    items.extend(self._flatten_json(v, new_key, sep=sep).items())
-                else:
-                    items.append((new_key, v))
+        """
+        Flatten nested JSON structure.
 
-        return dict(items)
+        Iterative with an explicit work stack rather than recursive, so
+        deep Schema.org graphs don't pay a Python call per node or build
+        intermediate tuple lists at every level.
+        """
+        out: Dict[str, Any] = {}
+        stack = [(obj, parent_key)]
+
+        while stack:
+            cur, prefix = stack.pop()
+            if isinstance(cur, dict):
+                for k, v in cur.items():
+                    key = f"{prefix}{sep}{k}" if prefix else k
+                    if isinstance(v, (dict, list)):
+                        stack.append((v, key))
+                    else:
+                        out[key] = v
+            elif isinstance(cur, list):
+                for i, v in enumerate(cur):
+                    key = f"{prefix}{sep}{i}" if prefix else str(i)
+                    if isinstance(v, (dict, list)):
+                        stack.append((v, key))
+                    else:
+                        out[key] = v
+            elif prefix:
+                out[prefix] = cur
+
+        return out
 
     def _calculate_json_ld_confidence(self, data: Dict[str, Any]) -> float:
         """Calculate confidence score for JSON-LD extraction"""
@@ -485,18 +917,21 @@ class TieredScraper:
         if "foundingDate" in data:
             score += 0.1
 
-        # Additional business-specific properties
+        # Additional business-specific properties. The data is already
+        # flattened, so scanning the lowercased keys once replaces the
+        # old str(data) serialization of the whole payload per property.
         business_properties = [
-            "employeeCount",
+            "employeecount",
             "revenue",
             "founded",
             "industry",
-            "contactPoint",
+            "contactpoint",
             "location",
             "logo",
         ]
+        keys_blob = " ".join(data).lower()
         for prop in business_properties:
-            if prop in str(data).lower():
+            if prop in keys_blob:
                 score += 0.1
 
         return min(score, 1.0)
@@ -538,14 +973,17 @@ class TieredScraper:
         return min(score, 1.0)
 
     async def _scrape_with_requests_fallback(self, url: str) -> ScrapingResult:
-        """Fallback scraping method using requests and BeautifulSoup for Windows compatibility"""
+        """
+        Fallback scraping method using the shared aiohttp session when
+        Playwright is unavailable (e.g. Windows subprocess limitations).
+        Runs on the event loop, so concurrent scrapes keep overlapping
+        instead of blocking on a synchronous requests.get.
+        """
         try:
-            import requests
-            from bs4 import BeautifulSoup
-            import time
-
             start_time = time.time()
 
+            await self._ensure_session()
+
             # Set headers to mimic a real browser
             headers = {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -556,20 +994,18 @@ class TieredScraper:
                 "Upgrade-Insecure-Requests": "1",
             }
 
-            response = requests.get(url, headers=headers, timeout=25)
-
-            if response.status_code != 200:
+            status, content, _ = await self._request_with_limits(url, headers=headers)
+            if status != 200:
                 return ScrapingResult(
                     success=False,
                     data={},
                     method=ScrapingMethod.REQUESTS,
                     confidence=0.0,
                     processing_time=time.time() - start_time,
-                    error_message=f"HTTP {response.status_code}",
+                    error_message=f"HTTP {status}",
                 )
 
-            content = response.text
-            soup = BeautifulSoup(content, "html.parser")
+            soup = BeautifulSoup(content, _BS_PARSER)
 
             # Extract data similar to what Playwright would extract
             data = {}
@@ -594,47 +1030,42 @@ class TieredScraper:
             jsonld_data = []
             for script in json_ld_scripts:
                 try:
-                    import json
-
-                    json_data = json.loads(script.string)
-                    jsonld_data.append(json_data)
-                except:
+                    jsonld_data.append(_json_loads(script.string))
+                except (ValueError, TypeError):
                     continue
             data["jsonld"] = jsonld_data
 
             # Visible text content
             body_text = soup.body.get_text() if soup.body else ""
-            data["text_content"] = body_text[:8000]
+            body_text_capped = body_text[:8000]
+            data["text_content"] = body_text_capped
 
             # Links
             links = []
+            append = links.append
             for link in soup.find_all("a", href=True):
                 href = link["href"]
-                if href.startswith(("http://", "https://")):
-                    links.append(href)
+                if href[:4] == "http":
+                    append(href)
+                    if len(links) >= 500:
+                        break
             data["links"] = links
 
-            # Basic contact info extraction
-            text_lower = data["text_content"].lower() if "text_content" in data else ""
+            # Basic contact info extraction; the patterns are
+            # case-insensitive, so no lowered copy of the text is needed
 
             # Email extraction
-            import re
-
-            email_pattern = r"([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})"
-            email_match = re.search(email_pattern, text_lower)
+            email_match = _EMAIL_RE.search(body_text_capped)
             if email_match:
-                data["email"] = email_match.group(1)
+                data["email"] = email_match.group(0)
 
             # Phone extraction
-            phone_pattern = r"(\+?\d{1,2}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})"
-            phone_match = re.search(phone_pattern, text_lower)
+            phone_match = _PHONE_RE.search(body_text_capped)
             if phone_match:
-                data["phone"] = phone_match.group(1)
+                data["phone"] = phone_match.group(0)
 
             # Company name from domain
-            from urllib.parse import urlparse
-
-            domain = urlparse(url).netloc.replace("www.", "")
+            domain = _parse_url(url).netloc.replace("www.", "")
             data["potential_company_name"] = domain.split(".")[0]
 
             if not data:
@@ -675,10 +1106,30 @@ class TieredScraper:
 # Global scraper instance for reuse
 scraper_instance = None
 
+# Guards first-time construction: concurrent gather()ed callers must not
+# race into creating multiple scrapers (and leaking connection pools)
+_scraper_lock = asyncio.Lock()
+
 
 async def get_scraper() -> TieredScraper:
-    """Get or create a global scraper instance"""
+    """Get or create a global scraper instance with a live session"""
     global scraper_instance
-    if scraper_instance is None:
-        scraper_instance = TieredScraper()
+    async with _scraper_lock:
+        if scraper_instance is None:
+            scraper_instance = TieredScraper()
+        await scraper_instance._ensure_session()
     return scraper_instance
+
+
+def _close_scraper_at_exit():
+    """Best-effort close of the shared session on interpreter shutdown"""
+    if scraper_instance is not None and scraper_instance.session is not None:
+        try:
+            asyncio.run(scraper_instance.close())
+        except RuntimeError:
+            # A loop is still running (or already closed); the OS will
+            # reclaim the sockets at process exit anyway.
+            pass
+
+
+atexit.register(_close_scraper_at_exit)
@@ -3,24 +3,39 @@ Async orchestration with Celery and Redis
 """
 
 import asyncio
+import re
+import sys
+import time
+from functools import lru_cache
 from typing import Dict, Any, Optional
-from celery import Celery
-from sqlalchemy.orm import Session
+from celery import Celery, chain
+from celery.signals import (
+    task_postrun,
+    worker_process_init,
+    worker_process_shutdown,
+)
+from celery.states import READY_STATES
+from sqlalchemy.orm import scoped_session, sessionmaker
 import os
-from datetime import datetime
 
-from core.infrastructure.database import SessionLocal
-from core.domain.models.lead import Lead, ScrapingLog
-from core.domain.models.user import User
-from core.infrastructure.scraping.scraper import TieredScraper, ScrapingMethod
+from core.infrastructure.database import SessionLocal, engine
+from core.infrastructure.billing.subscription_service import SubscriptionService
+from core.domain.models.lead import Lead
+from core.infrastructure.scraping.scraper import (
+    TieredScraper,
+    ScrapingMethod,
+    ScrapingResult,
+)
 from core.infrastructure.enrichment.enricher import WaterfallEnricher
 from core.infrastructure.messaging.messenger import Messenger
 from core.infrastructure.database.crud import (
     get_lead,
+    get_lead_minimal,
     create_scraping_log,
     create_lead_enrichment_log,
     update_lead,
 )
+from core.domain.schemas.lead import LeadUpdate
 from core.domain.services.scoring import LeadScoringService
 from core.infrastructure.logging import (
     get_logger,
@@ -30,6 +45,32 @@ from core.infrastructure.logging import (
 
 logger = get_logger(__name__)
 
+# uvloop is a drop-in libuv event loop that speeds up the aiohttp-heavy
+# scraping loops; every loop created after this (including the
+# worker-lifetime loop) picks it up automatically
+if sys.platform != "win32":
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+# Serialize log payloads as JSON rather than str(dict): faster with
+# orjson, roughly half the bytes, and the stored column stays parseable
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj, default=str).decode()
+
+except ImportError:
+    import json
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, default=str)
+
+
 # Initialize Celery
 celery_app = Celery(
     "leadboost_orchestrator",
@@ -39,16 +80,426 @@ celery_app = Celery(
 
 # Configure Celery
 celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    # msgpack encodes dict-heavy payloads 2-3x faster and 30-50%
+    # smaller than JSON; json stays accepted so in-flight tasks from
+    # older deploys still decode. zstd compression shrinks the large
+    # HTML-derived result blobs further before they hit Redis.
+    task_serializer="msgpack",
+    accept_content=["msgpack", "json"],
+    result_serializer="msgpack",
+    result_compression="zstd",
     timezone="UTC",
     enable_utc=True,
     worker_prefetch_multiplier=1,
     task_acks_late=True,
     task_reject_on_worker_lost=True,
+    # Lead pipelines run for tens of seconds; disable per-task rate
+    # limiting bookkeeping and bound runaway tasks. Launch workers with
+    # -Ofair so a slow lead doesn't starve the other pool processes.
+    worker_disable_rate_limits=True,
+    task_time_limit=600,
+    task_soft_time_limit=540,
+    broker_connection_retry_on_startup=True,
+    # Keep broker/backend sockets warm instead of paying reconnect
+    # round-trips, and expire task results so the backend doesn't
+    # accumulate keys forever
+    broker_transport_options={
+        "socket_keepalive": True,
+        "health_check_interval": 30,
+    },
+    result_backend_transport_options={
+        "socket_keepalive": True,
+        "retry_on_timeout": True,
+    },
+    result_expires=3600,
+    # Stage tasks run on dedicated queues so I/O-heavy stages (scrape,
+    # enrich, message) can use a high-concurrency green-thread pool
+    # while scoring stays on prefork CPU workers
+    task_routes={
+        "*.scrape_stage_task": {"queue": "io"},
+        "*.enrich_stage_task": {"queue": "io"},
+        "*.score_stage_task": {"queue": "cpu"},
+        "*.message_stage_task": {"queue": "llm"},
+    },
+)
+
+# Scraped/enriched payload keys mapped to their lead columns; driving
+# the copies from these tables replaces the chains of membership checks
+# (order matters: og_description overrides description for about_text)
+_SCRAPED_FIELD_MAP = (
+    ("title", "company_name"),
+    ("description", "about_text"),
+    ("og_description", "about_text"),
+    ("email", "email"),
+    ("phone", "phone"),
+)
+# Matches a full LinkedIn URL inside the joined link list; one C-level
+# regex scan instead of a Python substring check per link
+_LINKEDIN_RE = re.compile(
+    r"https?://[^\s\"'<>]*linkedin\.com/[^\s\"'<>]*", re.IGNORECASE
+)
+
+# The pipeline services are stateless and config-driven, so each is
+# built once per process instead of once per task
+_SCORING_SERVICE = LeadScoringService()
+_ENRICHER = WaterfallEnricher()
+_MESSENGER = Messenger()
+
+_ENRICHMENT_FIELD_MAP = (
+    ("industry", "industry"),
+    ("employees", "employees"),
+    ("revenue_band", "revenue_band"),
+    ("founded_year", "founded_year"),
+    ("contact_name", "contact_name"),
+    ("contact_title", "contact_title"),
 )
 
+# Worker-lifetime event loop and scraper: created once per worker
+# process so TCP connections, TLS sessions and the headless browser are
+# reused across leads instead of being rebuilt for every task
+WORKER_LOOP: Optional[asyncio.AbstractEventLoop] = None
+WORKER_SCRAPER: Optional[TieredScraper] = None
+
+# Worker-scoped DB session factory: expire_on_commit=False avoids the
+# re-SELECT of attributes after every commit, and the session object is
+# reset (not discarded) between tasks so only the first task in a
+# worker pays session construction
+WORKER_SESSION = None
+
+
+@worker_process_init.connect
+def _init_worker(**kwargs):
+    """Create the per-process event loop, shared scraper and session"""
+    global WORKER_LOOP, WORKER_SCRAPER, WORKER_SESSION
+    WORKER_LOOP = asyncio.new_event_loop()
+    asyncio.set_event_loop(WORKER_LOOP)
+    WORKER_SCRAPER = TieredScraper()
+    WORKER_LOOP.run_until_complete(WORKER_SCRAPER._ensure_session())
+    WORKER_SESSION = scoped_session(
+        sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            expire_on_commit=False,
+            bind=engine,
+        )
+    )
+
+
+@worker_process_shutdown.connect
+def _shutdown_worker(**kwargs):
+    """Tear down the shared scraper, session and loop on worker exit"""
+    global WORKER_LOOP, WORKER_SCRAPER, WORKER_SESSION
+    if WORKER_SESSION is not None:
+        WORKER_SESSION.remove()
+        WORKER_SESSION = None
+    if WORKER_SCRAPER is not None and WORKER_LOOP is not None:
+        try:
+            WORKER_LOOP.run_until_complete(WORKER_SCRAPER.close())
+        except Exception as e:
+            logger.error(f"Worker scraper shutdown failed: {str(e)}")
+    if WORKER_LOOP is not None:
+        WORKER_LOOP.close()
+    WORKER_LOOP = None
+    WORKER_SCRAPER = None
+
+
+@task_postrun.connect
+def _cleanup_worker_session(**kwargs):
+    """Return the scoped session to a clean state after each task"""
+    # Roll back and empty the identity map rather than remove(): the
+    # session object survives across tasks, so the next task skips
+    # session construction instead of rebuilding it
+    if WORKER_SESSION is not None:
+        session = WORKER_SESSION()
+        session.rollback()
+        session.expunge_all()
+
+
+def _task_session():
+    """DB session for task work: worker-scoped when inside a worker"""
+    if WORKER_SESSION is not None:
+        return WORKER_SESSION()
+    return SessionLocal()
+
+
+def _release_task_session(db) -> None:
+    """Close the session unless the worker-scoped lifecycle owns it"""
+    if WORKER_SESSION is None:
+        db.close()
+
+
+# Entitlement changes are rare, so the AI-features flag is memoized per
+# organization for one TTL bucket instead of hitting the database on
+# every lead
+_AI_FEATURES_TTL = 60  # seconds
+
+
+@lru_cache(maxsize=10_000)
+def _ai_features_cached(organization_id: int, bucket: int) -> bool:
+    """Look up the AI-features entitlement for one TTL bucket"""
+    # Runs on an executor thread, so it keeps its own short-lived session
+    # rather than the thread-local worker-scoped one
+    db = SessionLocal()
+    try:
+        return SubscriptionService(db).can_use_ai_features(organization_id)
+    finally:
+        db.close()
+
+
+def _ai_features_enabled(organization_id: int) -> bool:
+    """Check AI-features entitlement with a short-lived cache"""
+    return _ai_features_cached(
+        organization_id, int(time.time() // _AI_FEATURES_TTL)
+    )
+
+
+def _scrape_lead(website: str):
+    """
+    Scrape a website on the worker-lifetime loop.
+
+    Falls back to a one-shot scraper when called outside a Celery worker
+    (e.g. inline processing from the API).
+    """
+    if WORKER_LOOP is not None and WORKER_SCRAPER is not None:
+        return WORKER_LOOP.run_until_complete(WORKER_SCRAPER.scrape(website))
+
+    async def _scrape_once():
+        scraper = TieredScraper()
+        try:
+            await scraper._ensure_session()
+            return await scraper.scrape(website)
+        finally:
+            await scraper.close()
+
+    return asyncio.run(_scrape_once())
+
+
+def _scrape_many(websites) -> list:
+    """
+    Scrape a batch of websites concurrently on the worker-lifetime loop.
+
+    Same fallback behavior as _scrape_lead when called outside a worker;
+    failures come back as exceptions in their slot, not raised.
+    """
+    if WORKER_LOOP is not None and WORKER_SCRAPER is not None:
+        return WORKER_LOOP.run_until_complete(WORKER_SCRAPER.scrape_many(websites))
+
+    async def _scrape_once():
+        scraper = TieredScraper()
+        try:
+            await scraper._ensure_session()
+            return await scraper.scrape_many(websites)
+        finally:
+            await scraper.close()
+
+    return asyncio.run(_scrape_once())
+
+
+def _scrape_and_check_ai(website: str, organization_id: int):
+    """
+    Run the scrape and the AI-entitlement check concurrently.
+
+    The two are independent network/DB waits, so overlapping them makes
+    the slower one set the latency instead of their sum. Returns a
+    (scraping_result, ai_enabled) pair.
+    """
+
+    async def _both(scraper):
+        return await asyncio.gather(
+            scraper.scrape(website),
+            asyncio.get_running_loop().run_in_executor(
+                None, _ai_features_enabled, organization_id
+            ),
+        )
+
+    if WORKER_LOOP is not None and WORKER_SCRAPER is not None:
+        return WORKER_LOOP.run_until_complete(_both(WORKER_SCRAPER))
+
+    async def _once():
+        scraper = TieredScraper()
+        try:
+            await scraper._ensure_session()
+            return await _both(scraper)
+        finally:
+            await scraper.close()
+
+    return asyncio.run(_once())
+
+
+def _scraped_update(scraping_result) -> Dict[str, Any]:
+    """Map a successful scraping result onto lead fields"""
+    update_data = {
+        "scrape_confidence": scraping_result.confidence,
+        "scrape_source": scraping_result.method.value,
+    }
+    scraped_data = scraping_result.data
+    for src, dst in _SCRAPED_FIELD_MAP:
+        value = scraped_data.get(src)
+        if value is not None:
+            update_data[dst] = value
+
+    linkedin_match = _LINKEDIN_RE.search(" ".join(scraped_data.get("links", ())))
+    if linkedin_match:
+        update_data["linkedin_url"] = linkedin_match.group(0)
+    return update_data
+
+
+def _enrichment_update(enrichment_result) -> Dict[str, Any]:
+    """Map an enrichment result onto lead fields"""
+    update_data = {
+        "enrichment_confidence": enrichment_result.confidence,
+        "enrichment_source": enrichment_result.method,
+    }
+    enriched_data = enrichment_result.data
+    for src, dst in _ENRICHMENT_FIELD_MAP:
+        value = enriched_data.get(src)
+        if value is not None:
+            update_data[dst] = value
+    return update_data
+
+
+def _log_scrape(db, lead, scraping_result) -> None:
+    """Record a scraping attempt in the database and structured log"""
+    create_scraping_log(
+        db=db,
+        lead_id=lead.id,
+        scraping_method=scraping_result.method.value,
+        success=scraping_result.success,
+        confidence_score=scraping_result.confidence,
+        error_message=scraping_result.error_message,
+        processing_time_ms=(
+            int(scraping_result.processing_time * 1000)
+            if scraping_result.processing_time
+            else None
+        ),
+        scraped_data=(
+            _json_dumps(scraping_result.data) if scraping_result.data else None
+        ),
+        commit=False,
+    )
+
+    log_scraping_attempt(
+        logger=logger,
+        url=lead.website,
+        method=scraping_result.method.value,
+        success=scraping_result.success,
+        confidence=scraping_result.confidence,
+        processing_time=scraping_result.processing_time or 0,
+        error_message=scraping_result.error_message,
+    )
+
+
+def _log_enrichment(db, lead, enrichment_result) -> None:
+    """Record an enrichment attempt in the database and structured log"""
+    create_lead_enrichment_log(
+        db=db,
+        lead_id=lead.id,
+        enrichment_type=enrichment_result.method,
+        enrichment_data=_json_dumps(enrichment_result.data),
+        confidence_score=enrichment_result.confidence,
+        processing_time_ms=enrichment_result.processing_time,
+        commit=False,
+    )
+
+    log_enrichment_attempt(
+        logger=logger,
+        lead_id=lead.id,
+        method=enrichment_result.method,
+        success=True,
+        confidence=enrichment_result.confidence,
+        processing_time=enrichment_result.processing_time or 0,
+    )
+
+
+def _finish_lead(db, lead, scraping_result, ai_enabled=None) -> Dict[str, Any]:
+    """
+    Run the log/enrich/score/message stages for a scraped lead.
+
+    Folds every stage's fields into one UPDATE staged (not committed)
+    on the caller's session, so single-lead and batch tasks alike can
+    commit the whole pipeline in one transaction. Callers that already
+    resolved the AI-features flag can pass it in via ai_enabled.
+    """
+    # Lead fields from all stages accumulate here and are written
+    # with a single UPDATE at the end of the pipeline
+    accumulated_update: Dict[str, Any] = {}
+
+    # Log scraping attempt
+    _log_scrape(db, lead, scraping_result)
+
+    if scraping_result.success:
+        # Update lead with scraped data
+        update_data = _scraped_update(scraping_result)
+        accumulated_update.update(update_data)
+        # Reflect scraped fields on the in-memory lead so the later
+        # stages (enrichment, scoring, messaging) see fresh values
+        for field, value in update_data.items():
+            setattr(lead, field, value)
+
+    # Step 2: Enrich the data
+    # Check once whether AI features are available; the same flag
+    # gates both enrichment and message generation below
+    if ai_enabled is None:
+        ai_enabled = _ai_features_enabled(lead.organization_id)
+
+    if ai_enabled:
+        enrichment_result = _ENRICHER.enrich_lead_data(
+            lead, scraping_result.data if scraping_result.success else {}
+        )
+    else:
+        # Skip enrichment if AI features are not available
+        enrichment_result = None
+        logger.info(
+            f"AI features not available for organization {lead.organization_id}, skipping enrichment"
+        )
+
+    if enrichment_result:
+        # Log enrichment attempt
+        _log_enrichment(db, lead, enrichment_result)
+
+        # Update lead with enrichment data
+        update_data = _enrichment_update(enrichment_result)
+        accumulated_update.update(update_data)
+        for field, value in update_data.items():
+            setattr(lead, field, value)
+
+    # Step 3: Score the lead
+    score_result = _SCORING_SERVICE.score_lead(lead)
+
+    # Update lead with score
+    accumulated_update["score"] = score_result.total_score
+    accumulated_update["qualification_label"] = score_result.qualification_label
+    lead.score = score_result.total_score
+    lead.qualification_label = score_result.qualification_label
+
+    # Step 4: Generate outreach message
+    if ai_enabled:
+        outreach_message = _MESSENGER.generate_message(lead)
+    else:
+        # Use a basic message if AI features are not available
+        outreach_message = (
+            "No outreach message generated - AI features not available on your plan"
+        )
+        logger.info(
+            f"AI features not available for organization {lead.organization_id}, using basic message"
+        )
+
+    if outreach_message:
+        accumulated_update["outreach_message"] = outreach_message
+
+    # Persist every stage's fields with a single UPDATE; the log rows
+    # above were only flushed, so the caller's commit writes the whole
+    # pipeline in one transaction
+    if accumulated_update:
+        update_lead(db, lead.id, LeadUpdate(**accumulated_update), commit=False)
+
+    return {
+        "status": "success",
+        "lead_id": lead.id,
+        "scraping_success": scraping_result.success,
+        "enrichment_success": bool(enrichment_result),
+    }
+
 
 @celery_app.task(bind=True, max_retries=3, default_retry_delay=60)
 def process_lead_task(self, lead_id: int) -> Dict[str, Any]:
@@ -57,199 +508,212 @@ def process_lead_task(self, lead_id: int) -> Dict[str, Any]:
     """
     logger.info(f"Starting lead processing task for lead_id: {lead_id}")
 
-    db = SessionLocal()
+    db = _task_session()
     try:
-        # Get the lead
-        lead = get_lead(db, lead_id)
+        # Get the lead: only the columns the scrape needs for now, so
+        # the wide TEXT columns aren't pulled ahead of a stage that can
+        # run for seconds
+        lead = get_lead_minimal(db, lead_id)
         if not lead:
             logger.error(f"Lead not found: {lead_id}")
             return {"error": f"Lead {lead_id} not found"}
 
-        # Step 1: Scrape the website
-        # Run the async scrape function in a new event loop
-        import concurrent.futures
-        import threading
-
-        def run_scrape():
-            import asyncio
-            import aiohttp
-            from core.infrastructure.scraping.scraper import TieredScraper
-
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-
-                async def scrape_directly():
-                    scraper = TieredScraper()
-                    # Initialize session directly in this event loop
-                    scraper.session = aiohttp.ClientSession(
-                        timeout=aiohttp.ClientTimeout(total=scraper.timeout)
-                    )
-                    try:
-                        result = await scraper.scrape(lead.website)
-                        return result
-                    finally:
-                        if scraper.session:
-                            await scraper.session.close()
-
-                return loop.run_until_complete(scrape_directly())
-            finally:
-                loop.close()
-
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(run_scrape)
-            scraping_result = future.result()
-
-        # Log scraping attempt
-        create_scraping_log(
-            db=db,
-            lead_id=lead.id,
-            scraping_method=scraping_result.method.value,
-            success=scraping_result.success,
-            confidence_score=scraping_result.confidence,
-            error_message=scraping_result.error_message,
-            processing_time_ms=(
-                int(scraping_result.processing_time * 1000)
-                if scraping_result.processing_time
-                else None
-            ),
-            scraped_data=str(scraping_result.data) if scraping_result.data else None,
+        # Step 1: Scrape the website on the worker-lifetime loop while
+        # the AI-entitlement check runs alongside it
+        scraping_result, ai_enabled = _scrape_and_check_ai(
+            lead.website, lead.organization_id
         )
 
-        log_scraping_attempt(
-            logger=logger,
-            url=lead.website,
-            method=scraping_result.method.value,
-            success=scraping_result.success,
-            confidence=scraping_result.confidence,
-            processing_time=scraping_result.processing_time or 0,
-            error_message=scraping_result.error_message,
-        )
+        # Hydrate the rest of the row now that scraping is done; the
+        # identity map fills the deferred columns on the same instance,
+        # and enrichment/scoring/messaging below read the full lead
+        lead = get_lead(db, lead_id)
+        if not lead:
+            # Deleted while the scrape ran; don't burn retries on it
+            logger.error(f"Lead not found after scrape: {lead_id}")
+            return {"error": f"Lead {lead_id} not found"}
+
+        result = _finish_lead(db, lead, scraping_result, ai_enabled=ai_enabled)
+
+        # Commit all changes
+        db.commit()
+
+        logger.info(f"Lead processing completed successfully for lead_id: {lead_id}")
+        return result
+
+    except Exception as exc:
+        logger.error(f"Lead processing failed for lead_id {lead_id}: {str(exc)}")
+        # Retry the task
+        raise self.retry(exc=exc, countdown=60, max_retries=3)
+
+    finally:
+        _release_task_session(db)
+
+
+@celery_app.task(bind=True, max_retries=3, default_retry_delay=60)
+def process_leads_batch(self, lead_ids) -> Dict[str, Any]:
+    """
+    Celery task to process a batch of leads in one go.
+
+    Amortizes the per-task overhead (deserialization, session checkout,
+    result write) across the batch: one SELECT fetches all leads, the
+    websites are scraped concurrently on the worker loop, and every
+    lead's stages commit in a single transaction at the end.
+    """
+    logger.info(f"Starting batch processing task for {len(lead_ids)} leads")
+
+    db = _task_session()
+    try:
+        leads = db.query(Lead).filter(Lead.id.in_(lead_ids)).all()
+        if not leads:
+            logger.error(f"No leads found for batch: {lead_ids}")
+            return {"status": "success", "processed": 0, "results": []}
+
+        scraping_results = _scrape_many([lead.website for lead in leads])
+
+        results = []
+        for lead, scraping_result in zip(leads, scraping_results):
+            if isinstance(scraping_result, Exception):
+                scraping_result = ScrapingResult(
+                    success=False,
+                    data={},
+                    method=ScrapingMethod.REQUESTS,
+                    confidence=0.0,
+                    processing_time=0.0,
+                    error_message=str(scraping_result),
+                )
+            results.append(_finish_lead(db, lead, scraping_result))
+
+        # One commit covers every lead's logs and UPDATE
+        db.commit()
+
+        logger.info(f"Batch processing completed for {len(results)} leads")
+        return {"status": "success", "processed": len(results), "results": results}
+
+    except Exception as exc:
+        logger.error(f"Batch lead processing failed: {str(exc)}")
+        raise self.retry(exc=exc, countdown=60, max_retries=3)
+
+    finally:
+        _release_task_session(db)
+
+
+@celery_app.task(bind=True, max_retries=3, default_retry_delay=60)
+def scrape_stage_task(self, lead_id: int) -> Dict[str, Any]:
+    """Chain stage 1: scrape the lead's website and persist the fields"""
+    db = _task_session()
+    try:
+        lead = get_lead_minimal(db, lead_id)
+        if not lead:
+            logger.error(f"Lead not found: {lead_id}")
+            return {"error": f"Lead {lead_id} not found", "scraping_success": False}
+
+        scraping_result = _scrape_lead(lead.website)
+        _log_scrape(db, lead, scraping_result)
 
         if scraping_result.success:
-            # Update lead with scraped data
-            update_data = {
-                "scrape_confidence": scraping_result.confidence,
-                "scrape_source": scraping_result.method.value,
-            }
-
-            # Extract relevant data from scraping result
-            scraped_data = scraping_result.data
-            if "title" in scraped_data:
-                update_data["company_name"] = scraped_data["title"]
-            if "description" in scraped_data:
-                update_data["about_text"] = scraped_data["description"]
-            if "og_description" in scraped_data:
-                update_data["about_text"] = scraped_data["og_description"]
-            if "email" in scraped_data:
-                update_data["email"] = scraped_data["email"]
-            if "phone" in scraped_data:
-                update_data["phone"] = scraped_data["phone"]
-            if "links" in scraped_data:
-                for link in scraped_data["links"]:
-                    if "linkedin.com" in link:
-                        update_data["linkedin_url"] = link
-                        break
-
-            # Update the lead
-            from core.domain.schemas.lead import LeadUpdate
-
-            lead_update_obj = LeadUpdate(**update_data)
-            update_lead(db, lead_id, lead_update_obj)
-
-        # Step 2: Enrich the data
-        # Check if AI features are available for this organization
-        from core.infrastructure.billing.subscription_service import SubscriptionService
-
-        db_subscription = SessionLocal()
-        subscription_service = SubscriptionService(db_subscription)
-
-        if subscription_service.can_use_ai_features(lead.organization_id):
-            enricher = WaterfallEnricher()
-            enrichment_result = enricher.enrich_lead_data(
-                lead, scraping_result.data if scraping_result.success else {}
+            update_lead(
+                db,
+                lead_id,
+                LeadUpdate(**_scraped_update(scraping_result)),
+                commit=False,
+            )
+        db.commit()
+
+        return {
+            "lead_id": lead_id,
+            "scraping_success": scraping_result.success,
+            "scraped_data": scraping_result.data if scraping_result.success else {},
+        }
+
+    except Exception as exc:
+        logger.error(f"Scrape stage failed for lead_id {lead_id}: {str(exc)}")
+        raise self.retry(exc=exc, countdown=60, max_retries=3)
+
+    finally:
+        _release_task_session(db)
+
+
+@celery_app.task(bind=True, max_retries=3, default_retry_delay=60)
+def enrich_stage_task(self, prev: Dict[str, Any], lead_id: int) -> Dict[str, Any]:
+    """Chain stage 2: enrich the lead with the scraped data from stage 1"""
+    db = _task_session()
+    try:
+        lead = get_lead(db, lead_id)
+        if not lead:
+            return prev
+
+        if _ai_features_enabled(lead.organization_id):
+            enrichment_result = _ENRICHER.enrich_lead_data(
+                lead, prev.get("scraped_data") or {}
             )
         else:
-            # Skip enrichment if AI features are not available
             enrichment_result = None
             logger.info(
                 f"AI features not available for organization {lead.organization_id}, skipping enrichment"
             )
 
-        # Close the subscription DB session
-        db_subscription.close()
-
         if enrichment_result:
-            # Log enrichment attempt
-            create_lead_enrichment_log(
-                db=db,
-                lead_id=lead.id,
-                enrichment_type=enrichment_result.method,
-                enrichment_data=str(enrichment_result.data),
-                confidence_score=enrichment_result.confidence,
-                processing_time_ms=enrichment_result.processing_time,
+            _log_enrichment(db, lead, enrichment_result)
+            update_lead(
+                db,
+                lead_id,
+                LeadUpdate(**_enrichment_update(enrichment_result)),
+                commit=False,
             )
+        db.commit()
 
-            log_enrichment_attempt(
-                logger=logger,
-                lead_id=lead.id,
-                method=enrichment_result.method,
-                success=True,
-                confidence=enrichment_result.confidence,
-                processing_time=enrichment_result.processing_time or 0,
-            )
+        prev["enrichment_success"] = bool(enrichment_result)
+        return prev
 
-            # Update lead with enrichment data
-            update_data = {
-                "enrichment_confidence": enrichment_result.confidence,
-                "enrichment_source": enrichment_result.method,
-            }
-
-            # Extract relevant data from enrichment result
-            enriched_data = enrichment_result.data
-            if "industry" in enriched_data:
-                update_data["industry"] = enriched_data["industry"]
-            if "employees" in enriched_data:
-                update_data["employees"] = enriched_data["employees"]
-            if "revenue_band" in enriched_data:
-                update_data["revenue_band"] = enriched_data["revenue_band"]
-            if "founded_year" in enriched_data:
-                update_data["founded_year"] = enriched_data["founded_year"]
-            if "contact_name" in enriched_data:
-                update_data["contact_name"] = enriched_data["contact_name"]
-            if "contact_title" in enriched_data:
-                update_data["contact_title"] = enriched_data["contact_title"]
-
-            # Update the lead
-            from core.domain.schemas.lead import LeadUpdate
-
-            lead_update_obj = LeadUpdate(**update_data)
-            update_lead(db, lead_id, lead_update_obj)
-
-        # Step 3: Score the lead
-        scoring_service = LeadScoringService()
-        score_result = scoring_service.score_lead(lead)
-
-        # Update lead with score
-        update_data = {
-            "score": score_result.total_score,
-            "qualification_label": score_result.qualification_label,
-        }
-        from core.domain.schemas.lead import LeadUpdate
+    except Exception as exc:
+        logger.error(f"Enrichment stage failed for lead_id {lead_id}: {str(exc)}")
+        raise self.retry(exc=exc, countdown=60, max_retries=3)
+
+    finally:
+        _release_task_session(db)
+
+
+@celery_app.task(bind=True, max_retries=3, default_retry_delay=60)
+def score_stage_task(self, prev: Dict[str, Any], lead_id: int) -> Dict[str, Any]:
+    """Chain stage 3: score the lead on its persisted fields"""
+    db = _task_session()
+    try:
+        lead = get_lead(db, lead_id)
+        if not lead:
+            return prev
+
+        score_result = _SCORING_SERVICE.score_lead(lead)
+        update_lead(
+            db,
+            lead_id,
+            LeadUpdate(
+                score=score_result.total_score,
+                qualification_label=score_result.qualification_label,
+            ),
+        )
+        return prev
 
-        lead_update_obj = LeadUpdate(**update_data)
-        update_lead(db, lead_id, lead_update_obj)
+    except Exception as exc:
+        logger.error(f"Scoring stage failed for lead_id {lead_id}: {str(exc)}")
+        raise self.retry(exc=exc, countdown=60, max_retries=3)
+
+    finally:
+        _release_task_session(db)
 
-        # Step 4: Generate outreach message
-        # Check if AI features are available for this organization
-        db_subscription = SessionLocal()
-        subscription_service = SubscriptionService(db_subscription)
 
-        if subscription_service.can_use_ai_features(lead.organization_id):
-            messenger = Messenger()
-            outreach_message = messenger.generate_message(lead)
+@celery_app.task(bind=True, max_retries=3, default_retry_delay=60)
+def message_stage_task(self, prev: Dict[str, Any], lead_id: int) -> Dict[str, Any]:
+    """Chain stage 4: generate and persist the outreach message"""
+    db = _task_session()
+    try:
+        lead = get_lead(db, lead_id)
+        if not lead:
+            return prev
+
+        if _ai_features_enabled(lead.organization_id):
+            outreach_message = _MESSENGER.generate_message(lead)
         else:
-            # Use a basic message if AI features are not available
             outreach_message = (
                 "No outreach message generated - AI features not available on your plan"
             )
@@ -257,58 +721,63 @@ def process_lead_task(self, lead_id: int) -> Dict[str, Any]:
                 f"AI features not available for organization {lead.organization_id}, using basic message"
             )
 
-        # Close the subscription DB session
-        db_subscription.close()
-
         if outreach_message:
-            update_data = {"outreach_message": outreach_message}
-            from core.domain.schemas.lead import LeadUpdate
+            update_lead(db, lead_id, LeadUpdate(outreach_message=outreach_message))
 
-            lead_update_obj = LeadUpdate(**update_data)
-            update_lead(db, lead_id, lead_update_obj)
-
-        # Commit all changes
-        db.commit()
-
-        logger.info(f"Lead processing completed successfully for lead_id: {lead_id}")
-        return {
-            "status": "success",
-            "lead_id": lead_id,
-            "scraping_success": scraping_result.success,
-            "enrichment_success": bool(enrichment_result),
-        }
+        logger.info(f"Lead processing chain completed for lead_id: {lead_id}")
+        prev["status"] = "success"
+        return prev
 
     except Exception as exc:
-        logger.error(f"Lead processing failed for lead_id {lead_id}: {str(exc)}")
-        # Retry the task
+        logger.error(f"Message stage failed for lead_id {lead_id}: {str(exc)}")
         raise self.retry(exc=exc, countdown=60, max_retries=3)
 
     finally:
-        db.close()
+        _release_task_session(db)
 
 
-import asyncio
-import concurrent.futures
+def process_lead_chain(lead_id: int):
+    """
+    Dispatch the lead pipeline as a chain of per-stage tasks.
+
+    Each stage runs on its own queue (see task_routes), so the
+    I/O-bound scrape/enrich/message stages can be served by a
+    high-concurrency pool without tying up CPU workers for the whole
+    pipeline the way the monolithic task does.
+    """
+    return chain(
+        scrape_stage_task.s(lead_id),
+        enrich_stage_task.s(lead_id),
+        score_stage_task.s(lead_id),
+        message_stage_task.s(lead_id),
+    ).apply_async()
+
+
+# Cap how many leads the API process works on at once so a burst of
+# requests can't flood the shared executor and stall the event loop
+_CONCURRENCY = asyncio.Semaphore(int(os.getenv("LEAD_CONCURRENCY", "50")))
 
 
 async def process_lead_async(lead_id: int) -> Dict[str, Any]:
     """
     Asynchronous function to trigger lead processing
     """
-    # Run the Celery task in a thread pool to avoid blocking
-    loop = asyncio.get_event_loop()
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        result = await loop.run_in_executor(executor, process_lead_task, lead_id)
-    return result
+    # Run the task off the event loop on the shared default executor
+    # instead of building and tearing down a thread pool per call
+    async with _CONCURRENCY:
+        return await asyncio.to_thread(process_lead_task, lead_id)
 
 
 def get_task_status(task_id: str) -> Dict[str, Any]:
     """
     Get the status of a processing task
     """
-    task = celery_app.AsyncResult(task_id)
+    # Fetch the task meta once; task.status / task.ready() / task.result
+    # each hit the result backend separately
+    meta = celery_app.backend.get_task_meta(task_id)
+    status = meta.get("status", "PENDING")
     return {
         "task_id": task_id,
-        "status": task.status,
-        "result": task.result if task.ready() else None,
+        "status": status,
+        "result": meta.get("result") if status in READY_STATES else None,
     }